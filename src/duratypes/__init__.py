@@ -16,9 +16,14 @@ from .core import (
     InvalidTypeError,
     InvalidValueError,
     Minutes,
+    NonNegativeDuration,
+    PositiveDuration,
     Seconds,
     format_duration,
+    format_durations,
     parse_duration,
+    parse_durations,
+    validate_duration,
 )
 
 __all__ = [
@@ -30,7 +35,12 @@ __all__ = [
     "InvalidTypeError",
     "InvalidValueError",
     "Minutes",
+    "NonNegativeDuration",
+    "PositiveDuration",
     "Seconds",
     "format_duration",
+    "format_durations",
     "parse_duration",
+    "parse_durations",
+    "validate_duration",
 ]
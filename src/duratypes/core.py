@@ -1,9 +1,11 @@
 import logging
 import math
 import re
+from collections.abc import Iterable
+from functools import lru_cache
 from typing import Annotated
 
-from pydantic import BeforeValidator, TypeAdapter
+from pydantic import BeforeValidator, Field, TypeAdapter
 
 
 # Custom exception hierarchy
@@ -49,6 +51,42 @@ _UNIT_MULTIPLIERS = {
     "s": 1,
 }
 
+# Longest duration string accepted after stripping, bounding parse work. Raw
+# strings longer than this bypass the parse cache, so padded inputs can never
+# pin large cache keys in memory.
+_MAX_DURATION_LENGTH = 512
+
+# Every accepted spelling of each unit, so a compound unit token resolves
+# with one lookup
+_UNIT_ALIASES = {
+    alias: _UNIT_MULTIPLIERS[key]
+    for key, aliases in {
+        "y": ("y", "ys", "year", "years"),
+        "mo": ("mo", "mos", "month", "months"),
+        "w": ("w", "ws", "week", "weeks"),
+        "d": ("d", "ds", "day", "days"),
+        "h": ("h", "hs", "hour", "hours"),
+        "m": ("m", "min", "mins", "minute", "minutes"),
+        "s": ("s", "sec", "secs", "second", "seconds"),
+    }.items()
+    for alias in aliases
+}
+
+# Units emitted by format_duration, largest first
+_FORMAT_UNITS = (
+    ("y", SECONDS_PER_YEAR),
+    ("mo", SECONDS_PER_MONTH),
+    ("w", SECONDS_PER_WEEK),
+    ("d", SECONDS_PER_DAY),
+    ("h", SECONDS_PER_HOUR),
+    ("m", SECONDS_PER_MINUTE),
+    ("s", 1),
+)
+
+# Pre-built strings for small unit counts, which cover nearly every component
+# of a formatted duration (seconds and minutes are always below 60)
+_SMALL_INT_STR = tuple(str(i) for i in range(256))
+
 # Logger for debugging
 logger = logging.getLogger(__name__)
 
@@ -61,16 +99,16 @@ __all__ = [
     "InvalidTypeError",
     "InvalidValueError",
     "Minutes",
+    "NonNegativeDuration",
+    "PositiveDuration",
     "Seconds",
     "format_duration",
+    "format_durations",
     "parse_duration",
+    "parse_durations",
+    "validate_duration",
 ]
 
-_COMPOUND_RE = re.compile(
-    r"(?P<value>\d+(?:\.\d+)?)\s*"
-    r"(?P<unit>y(?:ear)?s?|mo(?:nth)?s?|w(?:eek)?s?|d(?:ay)?s?|h(?:our)?s?|m(?:in(?:ute)?s?)?|s(?:ec(?:ond)?s?)?)",
-    re.IGNORECASE,
-)
 _ISO_RE = re.compile(
     r"^(?P<sign>[+-])?P(?:\d+Y)?(?:\d+M)?(?:(?P<d>\d+(?:\.\d+)?)D)?"
     r"(?:T"
@@ -79,37 +117,27 @@ _ISO_RE = re.compile(
     r"(?:(?P<s>[+-]?\d+(?:\.\d+)?)S)?)?$",
     re.IGNORECASE,
 )
-_LEADING_SIGN = re.compile(r"^(?P<sign>[+-])\s*(?P<rest>.*)$")
 
 
-def _validate_input(v: str | int | float) -> None:
-    """Validate input type and basic constraints."""
-    if v is None:
-        raise InvalidValueError("Duration cannot be None")
-    if isinstance(v, bool):
-        raise InvalidTypeError("Duration cannot be a boolean")
+def _parse_simple(raw: str, sign: int) -> int | None:
+    """Parse a single integer with a one-letter unit (e.g., '30s') without regex."""
+    multiplier = _UNIT_MULTIPLIERS.get(raw[-1].lower())
+    if multiplier is None:
+        return None
 
+    # isdecimal() accepts exactly the digits matched by the regex '\d' class
+    digits = raw[:-1].rstrip()
+    if not digits.isdecimal():
+        return None
 
-def _parse_numeric(v: int | float) -> int:
-    """Parse numeric duration input."""
-    if not isinstance(v, int | float) or (isinstance(v, float) and math.isnan(v)):
-        raise InvalidValueError(f"Invalid numeric duration: {v!r}")
-    logger.debug(f"Parsing numeric duration: {v}")
-    return int(v)
+    return sign * int(digits) * multiplier
 
 
-def _extract_sign(raw: str, original: str | int | float) -> tuple[str, int]:
-    """Extract leading sign from duration string."""
-    sign = 1
-    m_sign = _LEADING_SIGN.match(raw)
-    if m_sign:
-        raw = m_sign.group("rest").strip()
-        sign = -1 if m_sign.group("sign") == "-" else 1
-        if not raw:
-            raise InvalidFormatError(
-                f"Invalid duration format: missing duration after sign in {original!r}"
-            )
-    return raw, sign
+def _iso_component(value: str | None) -> int | float:
+    """Convert a numeric duration component, keeping integer components exact."""
+    if not value:
+        return 0
+    return float(value) if "." in value else int(value)
 
 
 def _parse_iso8601(raw: str, sign: int) -> int | None:
@@ -118,15 +146,16 @@ def _parse_iso8601(raw: str, sign: int) -> int | None:
     if not m_iso:
         return None
 
-    logger.debug(f"Matched ISO 8601 format: {raw}")
-    if m_iso.group("sign"):
-        sign = -1 if m_iso.group("sign") == "-" else +1
+    logger.debug("Matched ISO 8601 format: %s", raw)
+    iso_sign, d_raw, h_raw, m_raw, s_raw = m_iso.group("sign", "d", "h", "m", "s")
+    if iso_sign:
+        sign = -1 if iso_sign == "-" else +1
 
     # Parse individual components (can have their own signs)
-    d = float(m_iso.group("d") or 0)
-    h = float(m_iso.group("h") or 0)
-    minutes = float(m_iso.group("m") or 0)
-    s = float(m_iso.group("s") or 0)
+    d = _iso_component(d_raw)
+    h = _iso_component(h_raw)
+    minutes = _iso_component(m_raw)
+    s = _iso_component(s_raw)
 
     total_seconds = int(
         d * SECONDS_PER_DAY + h * SECONDS_PER_HOUR + minutes * SECONDS_PER_MINUTE + s
@@ -135,42 +164,48 @@ def _parse_iso8601(raw: str, sign: int) -> int | None:
 
 
 def _parse_compound(raw: str, sign: int) -> int | None:
-    """Parse compound duration format (e.g., '1h30m45s')."""
-    total = 0.0
-    matches = list(_COMPOUND_RE.finditer(raw.lower()))
-
-    if not matches:
-        return None
-
-    # Check that matches cover the entire string without gaps
-    expected_pos = 0
-    for match in matches:
-        # Skip whitespace before the match
-        while expected_pos < len(raw) and raw[expected_pos].isspace():
-            expected_pos += 1
+    """
+    Parse compound duration format (e.g., '1h30m45s') in a single scan.
 
-        # Check if match starts where we expect
-        if match.start() != expected_pos:
-            # There's a gap or unexpected characters
+    Each component is a number (digits with an optional fraction), optional
+    whitespace, and a unit word resolved through _UNIT_ALIASES. Character
+    classes follow the regex they replace: isdecimal() for '\\d' and
+    isspace() for '\\s'.
+    """
+    # Integral components stay exact ints; only fractions switch to float
+    total: int | float = 0
+    n = len(raw)
+    i = 0
+    while i < n:
+        # Number: digits with an optional '.digits' fraction
+        start = i
+        while i < n and raw[i].isdecimal():
+            i += 1
+        if i == start:
             return None
+        if i < n and raw[i] == ".":
+            i += 1
+            fraction_start = i
+            while i < n and raw[i].isdecimal():
+                i += 1
+            if i == fraction_start:
+                return None
+        value = raw[start:i]
+
+        while i < n and raw[i].isspace():
+            i += 1
+
+        # Unit: the whole run of letters must be a known spelling
+        unit_start = i
+        while i < n and raw[i].isalpha():
+            i += 1
+        multiplier = _UNIT_ALIASES.get(raw[unit_start:i].casefold())
+        if multiplier is None:
+            return None
+        total += _iso_component(value) * multiplier
 
-        val = float(match.group("value"))
-        unit = match.group("unit").lower().strip()
-        key = "mo" if unit.startswith("mo") else unit[0]
-        multiplier = _UNIT_MULTIPLIERS[key]
-        total += val * multiplier
-
-        expected_pos = match.end()
-
-        logger.debug(f"Parsed component: {val}{unit} -> {val * multiplier} seconds")
-
-    # Check that we've consumed the entire string (ignoring trailing whitespace)
-    while expected_pos < len(raw) and raw[expected_pos].isspace():
-        expected_pos += 1
-
-    if expected_pos != len(raw):
-        # There are unconsumed characters
-        return None
+        while i < n and raw[i].isspace():
+            i += 1
 
     return sign * int(total)
 
@@ -179,6 +214,9 @@ def parse_duration(v: str | int | float) -> int:
     """
     Parse a duration string, integer, or float into seconds.
 
+    String inputs are memoized by their raw value, so repeated strings such as
+    "30s" or "PT1H30M" are resolved with a single cache lookup.
+
     Args:
         v: Duration input in various formats:
             - String: "30s", "5m", "1h30m", "PT1H30M", etc.
@@ -192,34 +230,79 @@ def parse_duration(v: str | int | float) -> int:
         InvalidTypeError: If the input type is not supported
         InvalidValueError: If the input value is invalid (None, NaN, empty string)
     """
-    _validate_input(v)
+    # Exact int and str cover nearly every call, so check them by identity
+    # before walking isinstance() hierarchies
+    if type(v) is int:
+        return v
+    if type(v) is str and len(v) <= _MAX_DURATION_LENGTH:
+        return _parse_duration_str(v)
 
-    # Handle numeric inputs
+    if v is None:
+        raise InvalidValueError("Duration cannot be None")
+    if isinstance(v, bool):
+        raise InvalidTypeError("Duration cannot be a boolean")
+
+    # Handle floats and int subclasses
     if isinstance(v, int | float):
-        return _parse_numeric(v)
+        if isinstance(v, float) and math.isnan(v):
+            raise InvalidValueError(f"Invalid numeric duration: {v!r}")
+        return int(v)
 
-    # Handle string inputs
+    # Handle str subclasses and over-long strings
     if not isinstance(v, str):
         raise InvalidTypeError(
             f"Duration must be str, int, or float, got {type(v).__name__}"
         )
 
-    raw = str(v).strip()
+    if len(v) > _MAX_DURATION_LENGTH:
+        # Parse without caching so the raw string never becomes a cache key
+        return _parse_duration_str.__wrapped__(v)
+    return _parse_duration_str(v)
+
+
+@lru_cache(maxsize=1024)
+def _parse_duration_str(v: str) -> int:
+    """Parse a duration string into seconds, memoized by the raw string."""
+    raw = v.strip()
     if not raw:
         raise InvalidValueError("Duration string cannot be empty")
+    if len(raw) > _MAX_DURATION_LENGTH:
+        raise InvalidFormatError(
+            f"Invalid duration format: input is {len(raw)} characters long, "
+            f"the maximum is {_MAX_DURATION_LENGTH}"
+        )
 
-    logger.debug(f"Parsing duration string: {raw!r}")
+    logger.debug("Parsing duration string: %r", raw)
 
     # Extract leading sign
-    raw, sign = _extract_sign(raw, v)
+    sign = 1
+    first = raw[0]
+    if first in "+-":
+        raw = raw[1:].lstrip()
+        if not raw:
+            raise InvalidFormatError(
+                f"Invalid duration format: missing duration after sign in {v!r}"
+            )
+        if first == "-":
+            sign = -1
 
-    # Try ISO 8601 format first
-    result = _parse_iso8601(raw, sign)
+    # Fast path for the common single-unit case ('30s', '5m', '1h')
+    result = _parse_simple(raw, sign)
     if result is not None:
         return result
 
-    # Try compound format
-    result = _parse_compound(raw, sign)
+    # Only ISO 8601 durations start with 'P' (or a sign of their own), so
+    # each string is handed to exactly one of the two parsers
+    try:
+        if raw[0] in "Pp+-":
+            result = _parse_iso8601(raw, sign)
+        else:
+            result = _parse_compound(raw, sign)
+    except OverflowError:
+        # Fractional components too large for a float
+        raise InvalidFormatError(
+            f"Invalid duration format: {v!r} is too large"
+        ) from None
     if result is not None:
         return result
 
@@ -231,10 +314,53 @@ def parse_duration(v: str | int | float) -> int:
     )
 
 
+# Allow callers (and tests) to inspect and reset the string cache via the
+# public function
+parse_duration.cache_clear = _parse_duration_str.cache_clear  # type: ignore[attr-defined]
+parse_duration.cache_info = _parse_duration_str.cache_info  # type: ignore[attr-defined]
+
+
+def parse_durations(values: Iterable[str | int | float]) -> list[int]:
+    """
+    Parse a batch of durations into seconds.
+
+    Equivalent to ``[parse_duration(v) for v in values]``, but exact ``int``
+    elements are returned as-is and exact ``str`` elements go straight to the
+    cached string parser, skipping the per-item type dispatch.
+
+    Args:
+        values: Duration inputs in any format accepted by parse_duration
+
+    Returns:
+        Durations in seconds, in input order
+
+    Raises:
+        InvalidFormatError: If an element has an invalid or unsupported format
+        InvalidTypeError: If an element's type is not supported
+        InvalidValueError: If an element is invalid (None, NaN, empty string)
+    """
+    # Bind the callees locally so the loop avoids a global lookup per element;
+    # over-long strings take the parse_duration path, which bypasses the cache
+    parse_str = _parse_duration_str
+    parse = parse_duration
+    max_length = _MAX_DURATION_LENGTH
+    return [
+        v
+        if type(v) is int
+        else parse_str(v)
+        if type(v) is str and len(v) <= max_length
+        else parse(v)
+        for v in values
+    ]
+
+
 def format_duration(seconds: int) -> str:
     """
     Format a duration in seconds into a human-readable string.
 
+    Results are memoized by value, so repeatedly formatting the same
+    durations costs a single cache lookup.
+
     Args:
         seconds: Duration in seconds (can be negative)
 
@@ -249,45 +375,107 @@ def format_duration(seconds: int) -> str:
             f"Seconds must be an integer, got {type(seconds).__name__}"
         )
 
-    logger.debug(f"Formatting duration: {seconds} seconds")
+    return _format_duration_int(seconds)
+
+
+@lru_cache(maxsize=4096)
+def _format_duration_int(seconds: int) -> str:
+    """Format integer seconds, memoized by value."""
+    logger.debug("Formatting duration: %s seconds", seconds)
 
     sign_str = "-" if seconds < 0 else ""
     seconds = abs(seconds)
-    parts = []
-
-    # Break down into largest units first
-    y, rem = divmod(seconds, SECONDS_PER_YEAR)
-    mo, rem = divmod(rem, SECONDS_PER_MONTH)
-    w, rem = divmod(rem, SECONDS_PER_WEEK)
-    d, rem = divmod(rem, SECONDS_PER_DAY)
-    h, rem = divmod(rem, SECONDS_PER_HOUR)
-    m, s = divmod(rem, SECONDS_PER_MINUTE)
-
-    if y:
-        parts.append(f"{y}y")
-    if mo:
-        parts.append(f"{mo}mo")
-    if w:
-        parts.append(f"{w}w")
-    if d:
-        parts.append(f"{d}d")
-    if h:
-        parts.append(f"{h}h")
-    if m:
-        parts.append(f"{m}m")
-    if s or not parts:  # Always include seconds if it's the only component
-        parts.append(f"{s}s")
-
-    result = sign_str + "".join(parts)
-    logger.debug(f"Formatted duration result: {result}")
+
+    # Single-unit results below an hour need no unit breakdown
+    if seconds < SECONDS_PER_MINUTE:
+        result = f"{sign_str}{seconds}s"
+    elif seconds < SECONDS_PER_HOUR and not seconds % SECONDS_PER_MINUTE:
+        result = f"{sign_str}{seconds // SECONDS_PER_MINUTE}m"
+    else:
+        # Break down into largest units first, emitting only non-zero units
+        parts = [sign_str]
+        for suffix, size in _FORMAT_UNITS:
+            if seconds >= size:
+                count, seconds = divmod(seconds, size)
+                parts.append(_SMALL_INT_STR[count] if count < 256 else str(count))
+                parts.append(suffix)
+        result = "".join(parts)
+
+    logger.debug("Formatted duration result: %s", result)
     return result
 
 
+# Allow callers (and tests) to inspect and reset the format cache via the
+# public function
+format_duration.cache_clear = _format_duration_int.cache_clear  # type: ignore[attr-defined]
+format_duration.cache_info = _format_duration_int.cache_info  # type: ignore[attr-defined]
+
+
+def format_durations(values: Iterable[int]) -> list[str]:
+    """
+    Format a batch of durations in seconds into human-readable strings.
+
+    Equivalent to ``[format_duration(v) for v in values]``, but exact ``int``
+    elements go straight to the cached formatter, skipping the per-item
+    type check.
+
+    Args:
+        values: Durations in seconds (can be negative)
+
+    Returns:
+        Human-readable duration strings, in input order
+
+    Raises:
+        InvalidTypeError: If an element is not an integer
+    """
+    # Bind the callees locally so the loop avoids a global lookup per element
+    format_int = _format_duration_int
+    format_any = format_duration
+    return [format_int(v) if type(v) is int else format_any(v) for v in values]
+
+
 # Pydantic annotated types
 Seconds = Annotated[int, BeforeValidator(parse_duration)]
 Minutes = Seconds
 Hours = Seconds
 Duration = Seconds
 
+# Constrained durations, built once here so models share the same constraint.
+# The constraint goes before the validator so Pydantic applies it to the int
+# schema, which keeps it in the JSON schema as exclusiveMinimum/minimum.
+PositiveDuration = Annotated[int, Field(gt=0), BeforeValidator(parse_duration)]
+NonNegativeDuration = Annotated[int, Field(ge=0), BeforeValidator(parse_duration)]
+
 # Singleton adapter for maximum reuse
 DurationAdapter: TypeAdapter[Duration] = TypeAdapter(Duration)
+
+
+def validate_duration(v: object) -> int:
+    """
+    Validate a duration through DurationAdapter, returning plain ints directly.
+
+    Exact ``int`` inputs are already valid durations, so they are returned
+    without entering Pydantic's validation machinery, and exact ``str`` inputs
+    that parse are served from the string parse cache. Everything else,
+    including invalid strings, ``bool`` and ``int`` subclasses, goes through
+    ``DurationAdapter.validate_python``.
+
+    Args:
+        v: Duration input accepted by DurationAdapter
+
+    Returns:
+        Duration in seconds as an integer
+
+    Raises:
+        ValidationError: If the input is not a valid duration
+    """
+    if type(v) is int:
+        return v
+    if type(v) is str and len(v) <= _MAX_DURATION_LENGTH:
+        # Invalid strings fall through so the adapter raises its usual
+        # ValidationError; over-long ones skip the cache via parse_duration
+        try:
+            return _parse_duration_str(v)
+        except DurationError:
+            pass
+    return DurationAdapter.validate_python(v)
@@ -1,4 +1,16 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
+from hypothesis import settings
+
+settings.register_profile("dev", max_examples=25, deadline=None)
+settings.register_profile("ci", max_examples=200, deadline=None)
+settings.register_profile("nightly", max_examples=500, deadline=None)
+# CI services set CI, so gated runs get the larger profile unless overridden
+settings.load_profile(
+    os.getenv("HYPOTHESIS_PROFILE", "ci" if os.getenv("CI") else "dev")
+)
 
 
 def pytest_addoption(parser):
@@ -32,3 +44,20 @@ def ini_value(request):
     :rtype: Any
     """
     return request.config.getini("test_resources")
+
+
+@pytest.fixture(scope="session")
+def shared_executor():
+    """
+    Fixture providing a thread pool shared by all thread safety tests.
+
+    Creating the pool once per session avoids spinning up fresh worker threads
+    in every test. Tests submit work and wait on their own futures, so sharing
+    the pool does not change what they check.
+
+    :return: A ThreadPoolExecutor with 15 workers, shut down at session end.
+    :rtype: concurrent.futures.ThreadPoolExecutor
+    """
+    executor = ThreadPoolExecutor(max_workers=15)
+    yield executor
+    executor.shutdown()
@@ -1,9 +1,19 @@
 """Integration tests for duratypes with Pydantic models."""
 
+from operator import attrgetter
+
 import pytest
-from pydantic import BaseModel, ValidationError, Field
+from pydantic import BaseModel, Field, ValidationError
 
-from duratypes import Duration, Seconds, Minutes, Hours, parse_duration
+from duratypes import (
+    Duration,
+    Hours,
+    Minutes,
+    NonNegativeDuration,
+    PositiveDuration,
+    Seconds,
+    parse_duration,
+)
 
 
 class SimpleTaskModel(BaseModel):
@@ -24,13 +34,13 @@ class DetailedTaskModel(BaseModel):
 class ProjectModel(BaseModel):
     """Complex model with nested duration fields."""
     name: str
-    tasks: SimpleTaskModel | None = None
+    tasks: list[SimpleTaskModel] = []
     total_duration: Duration | None = None
 
     def model_post_init(self, __context) -> None:
         """Calculate total duration from tasks."""
         if self.total_duration is None:
-            self.total_duration = sum(task.duration for task in self.tasks)
+            self.total_duration = sum(map(attrgetter("duration"), self.tasks))
 
 
 class ConfigModel(BaseModel):
@@ -235,6 +245,25 @@ class TestPydanticIntegration:
         assert props["timeout_seconds"]["exclusiveMinimum"] == 0
         assert props["max_hours"]["maximum"] == 24*3600
 
+    def test_constrained_duration_types(self):
+        """Test the pre-built positive and non-negative duration types."""
+        class ConstrainedModel(BaseModel):
+            timeout: PositiveDuration
+            delay: NonNegativeDuration = 0
+
+        model = ConstrainedModel(timeout="30s", delay="0s")
+        assert model.timeout == 30
+        assert model.delay == 0
+
+        with pytest.raises(ValidationError):
+            ConstrainedModel(timeout="0s")
+        with pytest.raises(ValidationError):
+            ConstrainedModel(timeout="30s", delay="-1m")
+
+        props = ConstrainedModel.model_json_schema()["properties"]
+        assert props["timeout"]["exclusiveMinimum"] == 0
+        assert props["delay"]["minimum"] == 0
+
     def test_model_copy_and_update(self):
         """Test model copying and updating with duration fields."""
         original = ConfigModel(cache_ttl=300, session_timeout=1800)  # Use parsed values